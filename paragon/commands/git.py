@@ -7,13 +7,60 @@ from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.syntax import Syntax
+from rich.style import Style
+from rich.text import Text
+from rich import box
 from pathlib import Path
 from typing import List
+from paragon.core.config import config
 import subprocess
+import tempfile
 import os
 
 console = Console()
 
+# Styles are parsed once at import; column specs are (header, style, width)
+_HEADER_STYLE = Style.parse("bold magenta")
+_CYAN = Style.parse("cyan")
+_GREEN = Style.parse("green")
+_YELLOW = Style.parse("yellow")
+_WHITE = Style.parse("white")
+
+_STATUS_COLUMNS = [("Status", _YELLOW, 10), ("File", _CYAN, None)]
+_LOG_COLUMNS = [
+    ("Hash", _CYAN, 10),
+    ("Author", _GREEN, 20),
+    ("When", _YELLOW, 15),
+    ("Message", _WHITE, None),
+]
+_BRANCH_COLUMNS = [
+    ("Current", _YELLOW, 8),
+    ("Branch", _CYAN, None),
+    ("Commit", _GREEN, 10),
+    ("Message", _WHITE, None),
+]
+
+# Status labels are built once and shared by every git_status table
+_STATUS_MARKUP = {
+    'M': Text("Modified", style="yellow"),
+    'A': Text("Added", style="green"),
+    '??': Text("Added", style="green"),
+    'D': Text("Deleted", style="red"),
+}
+
+
+def _decode(data: bytes) -> str:
+    """Decode a slice of git output for display."""
+    return data.decode('utf-8', 'replace')
+
+
+def _make_table(title: str, columns: list) -> Table:
+    """Build a table from a column spec using the pre-parsed styles."""
+    table = Table(title=title, show_header=True, header_style=_HEADER_STYLE, box=box.SIMPLE)
+    for header, style, width in columns:
+        table.add_column(header, style=style, width=width)
+    return table
+
 
 def git_status(args: List[str]) -> None:
     """Show git repository status."""
@@ -21,8 +68,8 @@ def git_status(args: List[str]) -> None:
         # Check if we're in a git repository
         result = subprocess.run(
             ['git', 'rev-parse', '--git-dir'],
-            capture_output=True,
-            text=True
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
         )
         
         if result.returncode != 0:
@@ -32,52 +79,48 @@ def git_status(args: List[str]) -> None:
         # Get current branch
         branch_result = subprocess.run(
             ['git', 'branch', '--show-current'],
-            capture_output=True,
-            text=True
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL
         )
-        current_branch = branch_result.stdout.strip()
+        current_branch = _decode(branch_result.stdout.strip())
         
         # Get status
         status_result = subprocess.run(
             ['git', 'status', '--porcelain'],
-            capture_output=True,
-            text=True
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL
         )
         
-        status_lines = status_result.stdout.strip().split('\n') if status_result.stdout.strip() else []
+        # splitlines() without strip() keeps the leading space of ' M' entries
+        status_lines = status_result.stdout.splitlines()
         
-        # Count changes
-        modified = [line for line in status_lines if line.startswith(' M')]
-        added = [line for line in status_lines if line.startswith('A') or line.startswith('??')]
-        deleted = [line for line in status_lines if line.startswith(' D')]
+        # Count changes in a single pass
+        n_mod = n_add = n_del = 0
+        for line in status_lines:
+            head = line[:2]
+            if head == b' M':
+                n_mod += 1
+            elif head[:1] in (b'A', b'?'):
+                n_add += 1
+            elif head == b' D':
+                n_del += 1
         
         # Display status
         info_text = f"[bold]Branch:[/bold] {current_branch}\n"
-        info_text += f"[bold]Modified:[/bold] {len(modified)}\n"
-        info_text += f"[bold]Added:[/bold] {len(added)}\n"
-        info_text += f"[bold]Deleted:[/bold] {len(deleted)}\n"
+        info_text += f"[bold]Modified:[/bold] {n_mod}\n"
+        info_text += f"[bold]Added:[/bold] {n_add}\n"
+        info_text += f"[bold]Deleted:[/bold] {n_del}\n"
         
         console.print(Panel(info_text, title="Git Status", border_style="blue"))
         
-        if status_lines and status_lines[0]:
-            table = Table(title="Changed Files", show_header=True, header_style="bold magenta")
-            table.add_column("Status", style="yellow", width=10)
-            table.add_column("File", style="cyan")
+        if status_lines:
+            table = _make_table("Changed Files", _STATUS_COLUMNS)
             
             for line in status_lines[:20]:
-                status = line[:2]
-                filename = line[3:]
-                
-                if status.strip() == 'M':
-                    status_display = "[yellow]Modified[/yellow]"
-                elif status.strip() == 'A' or status.strip() == '??':
-                    status_display = "[green]Added[/green]"
-                elif status.strip() == 'D':
-                    status_display = "[red]Deleted[/red]"
-                else:
-                    status_display = status
+                status = _decode(line[:2])
+                filename = _decode(line[3:])
                 
-                table.add_row(status_display, filename)
+                table.add_row(_STATUS_MARKUP.get(status.strip()) or Text(status), filename)
             
             console.print(table)
             
@@ -108,28 +151,29 @@ def git_log(args: List[str]) -> None:
     try:
         result = subprocess.run(
             ['git', 'log', f'-{count}', '--pretty=format:%h|%an|%ar|%s'],
-            capture_output=True,
-            text=True
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL
         )
         
         if result.returncode != 0:
             console.print("[red]Not a git repository or no commits found[/red]")
             return
         
-        commits = result.stdout.strip().split('\n')
+        commits = result.stdout.splitlines()
         
-        table = Table(title=f"Commit History (last {count})", show_header=True, header_style="bold magenta")
-        table.add_column("Hash", style="cyan", width=10)
-        table.add_column("Author", style="green", width=20)
-        table.add_column("When", style="yellow", width=15)
-        table.add_column("Message", style="white")
+        table = _make_table(f"Commit History (last {count})", _LOG_COLUMNS)
         
         for commit in commits:
             if not commit:
                 continue
-            parts = commit.split('|')
+            parts = commit.split(b'|')
             if len(parts) == 4:
-                table.add_row(parts[0], parts[1][:20], parts[2], parts[3][:50])
+                table.add_row(
+                    _decode(parts[0]),
+                    _decode(parts[1])[:20],
+                    _decode(parts[2]),
+                    _decode(parts[3])[:50]
+                )
         
         console.print(table)
         
@@ -148,26 +192,22 @@ def git_branches(args: List[str]) -> None:
         if show_all:
             cmd.append('-a')
         
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
         
         if result.returncode != 0:
             console.print("[red]Not a git repository[/red]")
             return
         
-        branches = result.stdout.strip().split('\n')
+        branches = result.stdout.splitlines()
         
-        table = Table(title="Git Branches", show_header=True, header_style="bold magenta")
-        table.add_column("Current", style="yellow", width=8)
-        table.add_column("Branch", style="cyan")
-        table.add_column("Commit", style="green", width=10)
-        table.add_column("Message", style="white")
+        table = _make_table("Git Branches", _BRANCH_COLUMNS)
         
         for branch in branches:
             if not branch.strip():
                 continue
             
-            is_current = branch.startswith('*')
-            branch = branch.lstrip('* ').strip()
+            is_current = branch.startswith(b'*')
+            branch = _decode(branch.lstrip(b'* ').strip())
             
             parts = branch.split(maxsplit=2)
             if len(parts) >= 2:
@@ -193,23 +233,65 @@ def git_branches(args: List[str]) -> None:
 def git_diff(args: List[str]) -> None:
     """Show git diff."""
     file_path = None
-    if args:
-        file_path = args[0]
+    max_lines = config.get("git.diff_max_lines", 500)
+    
+    # Parse args
+    i = 0
+    while i < len(args):
+        if args[i] in ['--max-lines', '-m'] and i + 1 < len(args):
+            max_lines = int(args[i + 1])
+            i += 2
+        else:
+            if file_path is None:
+                file_path = args[i]
+            i += 1
+    
+    if max_lines < 1:
+        console.print("[red]Max lines must be at least 1[/red]")
+        return
     
     try:
         cmd = ['git', 'diff']
         if file_path:
             cmd.append(file_path)
         
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
         
-        if result.returncode != 0:
+        # Keep only the first max_lines for display; spill the full diff to a
+        # temp file once it overflows so memory stays bounded. Only preview
+        # lines are decoded; the spill file receives git's raw bytes.
+        preview = []
+        spill = None
+        total_lines = 0
+        
+        try:
+            for line in proc.stdout:
+                total_lines += 1
+                if total_lines <= max_lines:
+                    preview.append(line)
+                    continue
+                if spill is None:
+                    spill = tempfile.NamedTemporaryFile('wb', delete=False, suffix='.diff', prefix='paragon-')
+                    spill.writelines(preview)
+                spill.write(line)
+        finally:
+            proc.stdout.close()
+            proc.wait()
+            if spill is not None:
+                spill.close()
+        
+        if proc.returncode != 0:
+            if spill is not None:
+                os.unlink(spill.name)
             console.print("[red]Error getting diff[/red]")
             return
         
-        diff_output = result.stdout
+        diff_output = _decode(b"".join(preview))
         
         if not diff_output.strip():
+            # Whitespace-only preview: the spill path is never shown, so drop it
+            if spill is not None:
+                os.unlink(spill.name)
             console.print("[green]No changes to show[/green]")
             return
         
@@ -217,6 +299,12 @@ def git_diff(args: List[str]) -> None:
         syntax = Syntax(diff_output, "diff", theme="monokai", line_numbers=False)
         console.print(Panel(syntax, title="Git Diff", border_style="blue", expand=True))
         
+        if spill is not None:
+            console.print(
+                f"\n[dim]Showing first {max_lines} of {total_lines} lines — "
+                f"full diff at {spill.name}[/dim]"
+            )
+        
     except FileNotFoundError:
         console.print("[red]Git is not installed or not in PATH[/red]")
     except Exception as e:
@@ -6,17 +6,77 @@ This module provides commands for network operations like IP lookup, HTTP status
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from alive_progress import alive_bar
+from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, MofNCompleteColumn
 import requests
+from requests.adapters import HTTPAdapter
+import array
+import asyncio
+import atexit
 import socket
+import shutil
+import struct
+import sys
 import time
 import os
-from typing import List
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple
 from paragon.core.config import config
+from paragon import __version__
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
 
 console = Console()
 
+# Shared session so repeated commands reuse pooled connections (DNS, TCP and TLS)
+_session = requests.Session()
+_session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16))
+_session.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=16))
+_session.headers['User-Agent'] = f"PythonParagon/{__version__}"
+atexit.register(_session.close)
+
+# Fallback for systems without a readable services database
+_WELL_KNOWN_SERVICES = {
+    20: 'ftp-data', 21: 'ftp', 22: 'ssh', 23: 'telnet', 25: 'smtp',
+    53: 'domain', 67: 'bootps', 68: 'bootpc', 69: 'tftp', 80: 'http',
+    110: 'pop3', 119: 'nntp', 123: 'ntp', 137: 'netbios-ns', 138: 'netbios-dgm',
+    139: 'netbios-ssn', 143: 'imap', 161: 'snmp', 162: 'snmp-trap', 389: 'ldap',
+    443: 'https', 445: 'microsoft-ds', 465: 'submissions', 514: 'syslog',
+    587: 'submission', 636: 'ldaps', 993: 'imaps', 995: 'pop3s',
+}
+
+_SERVICES: Dict[int, str] = {}
+
+
+def _services_path() -> str:
+    """Return the location of the OS services database."""
+    if os.name == 'nt':
+        return os.path.join(os.environ.get('SystemRoot', r'C:\Windows'), 'System32', 'drivers', 'etc', 'services')
+    return '/etc/services'
+
+
+def _service_name(port: int) -> str:
+    """Look up the TCP service name for a port, parsing the services database only once."""
+    if not _SERVICES:
+        try:
+            with open(_services_path(), 'r', encoding='utf-8', errors='ignore') as f:
+                for line in f:
+                    fields = line.split('#', 1)[0].split()
+                    if len(fields) < 2:
+                        continue
+                    number, _, protocol = fields[1].partition('/')
+                    if protocol == 'tcp' and number.isdigit():
+                        _SERVICES.setdefault(int(number), fields[0])
+        except OSError:
+            pass
+        
+        for number, name in _WELL_KNOWN_SERVICES.items():
+            _SERVICES.setdefault(number, name)
+    
+    return _SERVICES.get(port, "unknown")
+
 
 def public_ip(args: List[str]) -> None:
     """Get your public IP address."""
@@ -32,7 +92,7 @@ def public_ip(args: List[str]) -> None:
             api_url = config.get("api.ip_api", "https://api.ipify.org?format=json")
             timeout = config.get("network.timeout", 10)
             
-            response = requests.get(api_url, timeout=timeout)
+            response = _session.get(api_url, timeout=timeout)
             response.raise_for_status()
             
             data = response.json()
@@ -49,28 +109,66 @@ def public_ip(args: List[str]) -> None:
         console.print(f"[red]Error fetching public IP: {e}[/red]")
 
 
+HTTP_METHODS = ("GET", "POST", "HEAD")
+
+
+def _status_color(status_code: int) -> str:
+    """Pick a display color for an HTTP status code."""
+    if status_code < 300:
+        return "green"
+    elif status_code < 400:
+        return "yellow"
+    return "red"
+
+
+def _max_http_workers(url_count: int) -> int:
+    """Cap concurrent checks by URL count and the process file descriptor limit."""
+    workers = min(32, url_count)
+    if resource is not None:
+        soft_limit, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+        if soft_limit != resource.RLIM_INFINITY:
+            workers = min(workers, max(1, soft_limit // 4))
+    return workers
+
+
+def _check_url(url: str, method: str, timeout: float) -> requests.Response:
+    """Issue a single request for a status check using the shared session."""
+    return _session.request(method, url, timeout=timeout, allow_redirects=True)
+
+
 def http_status_checker(args: List[str]) -> None:
-    """Check HTTP status of a URL."""
-    if not args:
-        console.print("[red]Usage: http <url> [--method GET|POST|HEAD][/red]")
-        return
-    
-    url = args[0]
+    """Check HTTP status of one or more URLs."""
+    urls = []
     method = "GET"
     
-    # Parse method
-    i = 1
+    # Parse args
+    i = 0
     while i < len(args):
         if args[i] in ['--method', '-m'] and i + 1 < len(args):
             method = args[i + 1].upper()
             i += 2
         else:
+            urls.append(args[i])
             i += 1
     
+    if not urls:
+        console.print("[red]Usage: http <url> [<url> ...] [--method GET|POST|HEAD][/red]")
+        return
+    
+    if method not in HTTP_METHODS:
+        console.print(f"[red]Unsupported HTTP method: {method}[/red]")
+        return
+    
+    urls = [url if url.startswith(('http://', 'https://')) else f"https://{url}" for url in urls]
+    timeout = config.get("network.timeout", 10)
+    
+    if len(urls) > 1:
+        _check_many_urls(urls, method, timeout)
+        return
+    
+    url = urls[0]
+    
     try:
-        if not url.startswith(('http://', 'https://')):
-            url = f"https://{url}"
-        
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -78,25 +176,9 @@ def http_status_checker(args: List[str]) -> None:
             transient=True
         ) as progress:
             task = progress.add_task(f"Checking {url}...", total=None)
-            
-            timeout = config.get("network.timeout", 10)
-            
-            if method == "GET":
-                response = requests.get(url, timeout=timeout, allow_redirects=True)
-            elif method == "POST":
-                response = requests.post(url, timeout=timeout, allow_redirects=True)
-            elif method == "HEAD":
-                response = requests.head(url, timeout=timeout, allow_redirects=True)
-            else:
-                console.print(f"[red]Unsupported HTTP method: {method}[/red]")
-                return
+            response = _check_url(url, method, timeout)
         
-        if response.status_code < 300:
-            status_color = "green"
-        elif response.status_code < 400:
-            status_color = "yellow"
-        else:
-            status_color = "red"
+        status_color = _status_color(response.status_code)
         
         result_text = f"[bold]URL:[/bold] {url}\n"
         result_text += f"[bold]Method:[/bold] {method}\n"
@@ -121,6 +203,46 @@ def http_status_checker(args: List[str]) -> None:
         console.print(f"[red]Error checking URL: {e}[/red]")
 
 
+def _check_many_urls(urls: List[str], method: str, timeout: float) -> None:
+    """Check several URLs concurrently and render one summary table."""
+    results = {}
+    
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+        transient=True
+    ) as progress:
+        task = progress.add_task(f"Checking {len(urls)} URLs...", total=None)
+        
+        with ThreadPoolExecutor(max_workers=_max_http_workers(len(urls))) as executor:
+            futures = {executor.submit(_check_url, url, method, timeout): url for url in urls}
+            for future in as_completed(futures):
+                try:
+                    results[futures[future]] = future.result()
+                except Exception as e:
+                    results[futures[future]] = e
+    
+    table = Table(title=f"HTTP Status Check ({method})", show_header=True, header_style="bold magenta")
+    table.add_column("URL", style="cyan")
+    table.add_column("Status", justify="center")
+    table.add_column("Response Time", style="yellow", justify="right")
+    
+    for url in urls:
+        result = results[url]
+        if isinstance(result, Exception):
+            table.add_row(url, "[red]Error[/red]", f"[red]{type(result).__name__}[/red]")
+        else:
+            status_color = _status_color(result.status_code)
+            table.add_row(
+                url,
+                f"[{status_color}]{result.status_code}[/{status_color}]",
+                f"{result.elapsed.total_seconds():.3f}s"
+            )
+    
+    console.print(table)
+
+
 def port_scanner(args: List[str]) -> None:
     """Perform a basic port scan on a host."""
     if not args:
@@ -160,7 +282,16 @@ def port_scanner(args: List[str]) -> None:
         open_ports = []
         total_ports = end_port - start_port + 1
         
-        with alive_bar(total_ports, title='Scanning ports', bar='smooth', spinner='dots_waves') as bar:
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            console=console
+        ) as progress:
+            task = progress.add_task("Scanning ports", total=total_ports)
+            last_update = time.monotonic()
+            
             for port in range(start_port, end_port + 1):
                 sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
                 sock.settimeout(timeout)
@@ -169,10 +300,7 @@ def port_scanner(args: List[str]) -> None:
                     result = sock.connect_ex((host, port))
                     if result == 0:
                         open_ports.append(port)
-                        try:
-                            service = socket.getservbyport(port)
-                        except:
-                            service = "unknown"
+                        service = _service_name(port)
                         console.print(f"[green]✓ Port {port} is OPEN ({service})[/green]")
                 except socket.gaierror:
                     console.print(f"[red]Could not resolve hostname: {host}[/red]")
@@ -182,7 +310,13 @@ def port_scanner(args: List[str]) -> None:
                 finally:
                     sock.close()
                 
-                bar()
+                # Refresh the bar every 32 ports or 50 ms rather than on every port
+                now = time.monotonic()
+                if port & 31 == 0 or now - last_update > 0.05:
+                    progress.update(task, completed=port - start_port + 1)
+                    last_update = now
+            
+            progress.update(task, completed=total_ports)
         
         if open_ports:
             console.print(f"\n[bold green]Found {len(open_ports)} open port(s):[/bold green]")
@@ -196,6 +330,123 @@ def port_scanner(args: List[str]) -> None:
         console.print(f"[red]Error during port scan: {e}[/red]")
 
 
+ICMP_ECHO_REPLY = 0
+ICMP_ECHO_REQUEST = 8
+ICMP_ECHO_PAYLOAD = b'PythonParagon'.ljust(32, b'\x00')
+
+
+def _ones_complement_sum(data: bytes) -> int:
+    """Sum big-endian 16-bit words with end-around carry (RFC 1071)."""
+    if len(data) % 2:
+        data += b'\x00'
+    words = array.array('H', data)
+    if sys.byteorder == 'little':
+        words.byteswap()
+    total = sum(words)
+    while total >> 16:
+        total = (total & 0xFFFF) + (total >> 16)
+    return total
+
+
+# The payload never changes, so its share of the checksum is summed only once
+_ECHO_PAYLOAD_SUM = _ones_complement_sum(ICMP_ECHO_PAYLOAD)
+
+
+def _build_echo_request(ident: int, seq: int) -> bytes:
+    """Build an ICMP echo request packet with the given identifier and sequence."""
+    total = _ECHO_PAYLOAD_SUM + (ICMP_ECHO_REQUEST << 8) + ident + seq
+    while total >> 16:
+        total = (total & 0xFFFF) + (total >> 16)
+    checksum = ~total & 0xFFFF
+    return struct.pack('!BBHHH', ICMP_ECHO_REQUEST, 0, checksum, ident, seq) + ICMP_ECHO_PAYLOAD
+
+
+async def _ping_icmp(sock: socket.socket, ip_address: str, count: int, timeout: float) -> List[Optional[float]]:
+    """Fire all echo requests at once on one ICMP socket and reap replies as they arrive."""
+    loop = asyncio.get_running_loop()
+    sock.setblocking(False)
+    sock.connect((ip_address, 0))
+    
+    ident = os.getpid() & 0xFFFF
+    pending = {seq: loop.create_future() for seq in range(1, count + 1)}
+    sent_at = {}
+    
+    async def reap() -> None:
+        while not all(fut.done() for fut in pending.values()):
+            try:
+                data = await loop.sock_recv(sock, 1024)
+            except OSError:
+                return
+            received_at = time.perf_counter()
+            
+            # Raw-style sockets (e.g. macOS) prepend the IPv4 header
+            if data and data[0] >> 4 == 4:
+                data = data[(data[0] & 0x0F) * 4:]
+            if len(data) < 8:
+                continue
+            
+            icmp_type, _, _, _, seq = struct.unpack('!BBHHH', data[:8])
+            fut = pending.get(seq)
+            if icmp_type == ICMP_ECHO_REPLY and fut is not None and not fut.done():
+                fut.set_result((received_at - sent_at[seq]) * 1000)
+    
+    reaper = loop.create_task(reap())
+    
+    for seq, fut in pending.items():
+        sent_at[seq] = time.perf_counter()
+        try:
+            await loop.sock_sendall(sock, _build_echo_request(ident, seq))
+        except OSError:
+            fut.set_result(None)
+    
+    async def wait_reply(seq: int) -> Optional[float]:
+        try:
+            return await asyncio.wait_for(asyncio.shield(pending[seq]), timeout)
+        except asyncio.TimeoutError:
+            return None
+    
+    try:
+        return list(await asyncio.gather(*(wait_reply(seq) for seq in pending)))
+    finally:
+        reaper.cancel()
+
+
+async def _ping_tcp(ip_address: str, count: int, timeout: float) -> List[Optional[float]]:
+    """Fallback probe timing concurrent TCP handshakes to port 80."""
+    async def probe() -> Optional[float]:
+        start_time = time.perf_counter()
+        try:
+            _, writer = await asyncio.wait_for(asyncio.open_connection(ip_address, 80), timeout)
+        except (OSError, asyncio.TimeoutError):
+            return None
+        response_time = (time.perf_counter() - start_time) * 1000
+        writer.close()
+        return response_time
+    
+    return list(await asyncio.gather(*(probe() for _ in range(count))))
+
+
+async def _ping(ip_address: str, count: int, timeout: float = 2) -> Tuple[str, List[Optional[float]]]:
+    """
+    Ping a host with all probes in flight concurrently.
+    
+    Uses an unprivileged ICMP socket when the OS allows it and falls back
+    to TCP/80 handshakes otherwise.
+    
+    Returns:
+        Tuple of (probe method, per-attempt round-trip times in ms or None)
+    """
+    try:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_ICMP)
+    except OSError:
+        return "TCP/80", await _ping_tcp(ip_address, count, timeout)
+    
+    try:
+        return "ICMP", await _ping_icmp(sock, ip_address, count, timeout)
+    finally:
+        sock.close()
+
+
 def ping_host(args: List[str]) -> None:
     """Check if a host is reachable."""
     if not args:
@@ -224,30 +475,19 @@ def ping_host(args: List[str]) -> None:
             console.print(f"[red]Could not resolve hostname: {host}[/red]")
             return
         
+        method, results = asyncio.run(_ping(ip_address, count))
+        
         successful = 0
-        table = Table(title=f"Ping Results for {host}", show_header=True, header_style="bold magenta")
+        table = Table(title=f"Ping Results for {host} ({method})", show_header=True, header_style="bold magenta")
         table.add_column("Attempt", style="cyan", justify="center")
         table.add_column("Result", style="green")
         
-        for i in range(count):
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(2)
-            
-            try:
-                start_time = time.time()
-                result = sock.connect_ex((ip_address, 80))
-                end_time = time.time()
-                
-                if result == 0:
-                    successful += 1
-                    response_time = (end_time - start_time) * 1000
-                    table.add_row(f"{i + 1}/{count}", f"[green]✓ Reachable ({response_time:.2f}ms)[/green]")
-                else:
-                    table.add_row(f"{i + 1}/{count}", "[yellow]✗ No response[/yellow]")
-            except Exception as e:
-                table.add_row(f"{i + 1}/{count}", f"[red]✗ Error: {e}[/red]")
-            finally:
-                sock.close()
+        for i, response_time in enumerate(results):
+            if response_time is not None:
+                successful += 1
+                table.add_row(f"{i + 1}/{count}", f"[green]✓ Reachable ({response_time:.2f}ms)[/green]")
+            else:
+                table.add_row(f"{i + 1}/{count}", "[yellow]✗ No response[/yellow]")
         
         console.print(table)
         console.print(f"\n[bold]Success Rate:[/bold] {successful}/{count} ({successful/count*100:.1f}%)")
@@ -256,6 +496,23 @@ def ping_host(args: List[str]) -> None:
         console.print(f"[red]Error pinging host: {e}[/red]")
 
 
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+
+class _ProgressWriter:
+    """File wrapper that advances a Rich progress task on every write."""
+    
+    def __init__(self, f, progress: Progress, task) -> None:
+        self._f = f
+        self._progress = progress
+        self._task = task
+    
+    def write(self, data: bytes) -> int:
+        written = self._f.write(data)
+        self._progress.update(self._task, advance=len(data))
+        return written
+
+
 def wget_command(args: List[str]) -> None:
     """Download files from URLs."""
     if not args:
@@ -275,7 +532,7 @@ def wget_command(args: List[str]) -> None:
         console.print(f"[cyan]Downloading:[/cyan] {url}")
         console.print(f"[cyan]Saving to:[/cyan] {output_file}\n")
         
-        response = requests.get(url, stream=True, timeout=30)
+        response = _session.get(url, stream=True, timeout=30)
         response.raise_for_status()
         
         # Get file size if available
@@ -293,11 +550,10 @@ def wget_command(args: List[str]) -> None:
         ) as progress:
             task = progress.add_task("Downloading", total=total_size)
             
+            # Let shutil drive the copy in 1 MiB blocks instead of a Python-level chunk loop
+            response.raw.decode_content = True
             with open(output_file, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
-                        progress.update(task, advance=len(chunk))
+                shutil.copyfileobj(response.raw, _ProgressWriter(f, progress, task), DOWNLOAD_CHUNK_SIZE)
         
         # Show summary
         file_size = os.path.getsize(output_file)
@@ -319,11 +575,11 @@ def wget_command(args: List[str]) -> None:
         console.print(f"[red]✗[/red] Error: {e}")
 
 
+SIZE_UNITS = ['B', 'KB', 'MB', 'GB', 'TB', 'PB']
+
+
 def format_size(size: int) -> str:
     """Format byte size to human-readable string."""
-    size_float = float(size)
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if size_float < 1024:
-            return f"{size_float:.1f}{unit}"
-        size_float /= 1024
-    return f"{size_float:.1f}PB"
+    # Each unit spans 10 bits, so the bit length picks the unit without a divide loop
+    idx = min(max(0, (size.bit_length() - 1) // 10), len(SIZE_UNITS) - 1)
+    return f"{size / (1 << (10 * idx)):.1f}{SIZE_UNITS[idx]}"
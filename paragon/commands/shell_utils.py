@@ -9,9 +9,17 @@ from rich.syntax import Syntax
 from typing import List
 import time
 import os
+from paragon.core import shell
 
 console = Console()
 
+# Home directory resolved once; export refreshes it when HOME changes
+_HOME = os.path.expanduser("~")
+
+# Rendered printenv table, rebuilt only after export changes the environment
+_env_version = 0
+_env_table_cache = None
+
 
 def echo_command(args: List[str]):
     """Print text to console."""
@@ -19,23 +27,20 @@ def echo_command(args: List[str]):
         console.print("")
         return
     
-    text = " ".join(args)
-    
     # Check for special formatting flags
-    if text.startswith("-n "):
+    if args[0] == "-n":
         # No newline at end
-        text = text[3:]
-        console.print(text, end="")
-    elif text.startswith("-e "):
+        console.print(" ".join(args[1:]), end="")
+    elif args[0] == "-e":
         # Enable interpretation of backslash escapes
-        text = text[3:]
+        text = " ".join(args[1:])
         # Simple escape sequence handling
         text = text.replace("\\n", "\n")
         text = text.replace("\\t", "\t")
         text = text.replace("\\\\", "\\")
         console.print(text)
     else:
-        console.print(text)
+        console.print(" ".join(args))
 
 
 def history_command(args: List[str]):
@@ -132,9 +137,19 @@ def sleep_command(args: List[str]):
         console.print("\n[yellow]⚠[/yellow] Sleep interrupted")
 
 
+def _expand_home(path: str) -> str:
+    """Expand a leading ~ against the cached home directory."""
+    if path == "~" or path.startswith(("~/", "~" + os.sep)):
+        return _HOME + path[1:]
+    if path.startswith("~"):
+        # ~user forms still need a password database lookup
+        return os.path.expanduser(path)
+    return path
+
+
 def pwd_command(args: List[str]):
     """Print working directory."""
-    cwd = os.getcwd()
+    cwd = shell.current_directory or os.getcwd()
     console.print(Panel(
         f"[green]{cwd}[/green]",
         title="📂 Current Working Directory",
@@ -146,9 +161,10 @@ def cd_command(args: List[str]):
     """Change current directory."""
     if not args:
         # Go to home directory
-        home = os.path.expanduser("~")
+        home = _HOME
         try:
             os.chdir(home)
+            shell.current_directory = home
             console.print(f"[green]✓[/green] Changed to home directory: {home}")
         except Exception as e:
             console.print(f"[red]✗[/red] Failed: {e}")
@@ -162,12 +178,13 @@ def cd_command(args: List[str]):
         return
     
     # Expand ~ to home directory
-    path = os.path.expanduser(path)
+    path = _expand_home(path)
+    target = os.path.abspath(path)
     
     try:
-        os.chdir(path)
-        new_cwd = os.getcwd()
-        console.print(f"[green]✓[/green] Changed directory to: {new_cwd}")
+        os.chdir(target)
+        shell.current_directory = target
+        console.print(f"[green]✓[/green] Changed directory to: {target}")
     except FileNotFoundError:
         console.print(f"[red]✗[/red] Directory not found: {path}")
     except NotADirectoryError:
@@ -184,7 +201,8 @@ def export_command(args: List[str]):
         console.print("[red]✗[/red] Usage: export VAR=value")
         return
     
-    assignment = " ".join(args)
+    # A quoted or unspaced assignment arrives as one argument; only rejoin when split
+    assignment = args[0] if len(args) == 1 else " ".join(args)
     
     if "=" not in assignment:
         console.print("[red]✗[/red] Invalid format. Use: export VAR=value")
@@ -200,8 +218,13 @@ def export_command(args: List[str]):
     elif var_value.startswith("'") and var_value.endswith("'"):
         var_value = var_value[1:-1]
     
+    global _env_version, _HOME
+    
     try:
         os.environ[var_name] = var_value
+        _env_version += 1
+        if var_name == "HOME":
+            _HOME = os.path.expanduser("~")
         console.print(f"[green]✓[/green] Set {var_name}={var_value}")
     except Exception as e:
         console.print(f"[red]✗[/red] Failed to set environment variable: {e}")
@@ -209,10 +232,15 @@ def export_command(args: List[str]):
 
 def printenv_command(args: List[str]):
     """Print environment variable value."""
+    global _env_table_cache
+    
     if not args:
         # Print all environment variables (like env command)
-        from paragon.commands.system import show_environment
-        show_environment([])
+        if _env_table_cache is None or _env_table_cache[0] != _env_version:
+            from paragon.commands.system import environment_table
+            _env_table_cache = (_env_version, environment_table())
+        console.print(_env_table_cache[1])
+        console.print(f"\n[dim]Showing first 50 variables. Use: env <filter> to search[/dim]")
         return
     
     var_name = args[0]
@@ -9,11 +9,51 @@ from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from alive_progress import alive_bar
 import psutil
+import getpass
 import os
-from typing import List
+import platform
+import socket
+import time
+from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, List
+
+try:
+    import pwd
+    import grp
+except ImportError:  # Windows
+    pwd = grp = None
 
 console = Console()
 
+# Last non-blocking CPU reading for uptime; refreshed at most every 2 seconds
+_LAST_CPU = {'t': 0.0, 'v': 0.0}
+CPU_SAMPLE_MIN_INTERVAL = 2.0
+
+# Prime psutil's baseline so the first non-blocking reading is meaningful
+psutil.cpu_percent(interval=None)
+
+
+@lru_cache(maxsize=1)
+def _boot_time() -> float:
+    """Return the system boot time, read once per process."""
+    return psutil.boot_time()
+
+
+@lru_cache(maxsize=1)
+def _cpu_count_logical() -> int:
+    """Return the logical CPU count, read once per process."""
+    # os.cpu_count() is a single sysconf call; psutil is only the fallback
+    return os.cpu_count() or psutil.cpu_count(logical=True)
+
+
+@lru_cache(maxsize=1)
+def _cpu_count_physical() -> int:
+    """Return the physical CPU count, read once per process."""
+    return psutil.cpu_count(logical=False)
+
 
 def monitor_cpu(args: List[str]) -> None:
     """Monitor CPU usage in real-time."""
@@ -33,25 +73,29 @@ def monitor_cpu(args: List[str]) -> None:
             i += 1
     
     try:
+        # Only sample inside the loop; the table is built once sampling is done
+        samples = []
+        with alive_bar(count, title='Monitoring CPU', bar='filling', spinner='dots_waves') as bar:
+            for i in range(count):
+                # One sample of /proc/stat per reading; the aggregate is the per-core mean
+                per_core = psutil.cpu_percent(interval=interval, percpu=True)
+                samples.append((sum(per_core) / len(per_core), per_core))
+                bar()
+        
         table = Table(title="CPU Monitoring", show_header=True, header_style="bold magenta")
         table.add_column("Reading", style="cyan", justify="center")
         table.add_column("CPU Usage (%)", style="green", justify="center")
         table.add_column("Per Core", style="yellow")
         
-        with alive_bar(count, title='Monitoring CPU', bar='filling', spinner='dots_waves') as bar:
-            for i in range(count):
-                cpu_percent = psutil.cpu_percent(interval=interval)
-                per_core = psutil.cpu_percent(interval=0, percpu=True)
-                core_str = ", ".join([f"{c:.1f}%" for c in per_core])
-                
-                table.add_row(f"{i + 1}/{count}", f"{cpu_percent:.1f}%", core_str)
-                bar()
+        for i, (cpu_percent, per_core) in enumerate(samples):
+            core_str = ", ".join([f"{c:.1f}%" for c in per_core])
+            table.add_row(f"{i + 1}/{count}", f"{cpu_percent:.1f}%", core_str)
         
         console.print(table)
         
         # Summary
-        cpu_count = psutil.cpu_count(logical=True)
-        cpu_count_physical = psutil.cpu_count(logical=False)
+        cpu_count = _cpu_count_logical()
+        cpu_count_physical = _cpu_count_physical()
         console.print(f"\n[bold]Total CPU Cores:[/bold] {cpu_count} logical, {cpu_count_physical} physical")
         
     except Exception as e:
@@ -89,6 +133,60 @@ def monitor_memory(args: List[str]) -> None:
         console.print(f"[red]Error monitoring memory: {e}[/red]")
 
 
+# Processes can exit or be off-limits between listing and reading them
+_PROC_ERRORS = (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess)
+
+
+# Process objects kept between listings, keyed by PID. A cached object still
+# holds the CPU times from the previous call, so it needs no priming read and
+# its cpu_percent covers the time since that call. Validating an entry costs
+# as much as creating one; the cache exists for the CPU% window, not I/O.
+_PROC_CACHE: Dict[int, psutil.Process] = {}
+
+# psutil counts CPU time in clock ticks, so a freshly primed process needs a
+# sampling window this long before its cpu_percent means anything
+_CPU_SAMPLE_INTERVAL = 0.1
+
+
+def _cached_processes() -> List[psutil.Process]:
+    """Return a Process for every running PID, reusing cached objects where valid."""
+    pids = psutil.pids()
+    
+    # Forget processes that have exited
+    for pid in _PROC_CACHE.keys() - set(pids):
+        del _PROC_CACHE[pid]
+    
+    procs = []
+    primed = False
+    for pid in pids:
+        proc = _PROC_CACHE.get(pid)
+        try:
+            # is_running() builds a new Process to compare creation times, so a
+            # reused PID is replaced
+            if proc is None or not proc.is_running():
+                proc = psutil.Process(pid)
+                # Prime cpu_percent so the measured pass returns real values
+                proc.cpu_percent(None)
+                _PROC_CACHE[pid] = proc
+                primed = True
+            procs.append(proc)
+        except _PROC_ERRORS:
+            _PROC_CACHE.pop(pid, None)
+    
+    # Give newly primed processes a real window before they are measured
+    if primed:
+        time.sleep(_CPU_SAMPLE_INTERVAL)
+    
+    return procs
+
+
+def _proc_usage(proc: psutil.Process, field: str, total_memory: int) -> float:
+    """Read a process's CPU or memory percentage for the process table."""
+    if field == 'cpu_percent':
+        return proc.cpu_percent(None)
+    return proc.memory_info().rss / total_memory * 100
+
+
 def list_processes(args: List[str]) -> None:
     """List running processes sorted by resource usage."""
     limit = 10
@@ -116,10 +214,23 @@ def list_processes(args: List[str]) -> None:
         ) as progress:
             task = progress.add_task("Collecting process information...", total=None)
             
-            for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent']):
+            procs = _cached_processes()
+            
+            total_memory = psutil.virtual_memory().total
+            
+            # Only the sort key is read for every process; the other usage
+            # column is filled in for the rows that are displayed
+            sort_field = {'memory': 'memory_percent', 'cpu': 'cpu_percent'}.get(sort_by)
+            
+            for proc in procs:
                 try:
-                    processes.append(proc.info)
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    # oneshot() serves all fields below from a single read of /proc/<pid>/stat
+                    with proc.oneshot():
+                        entry = {'proc': proc, 'pid': proc.pid, 'name': proc.name()}
+                        if sort_field:
+                            entry[sort_field] = _proc_usage(proc, sort_field, total_memory)
+                        processes.append(entry)
+                except _PROC_ERRORS:
                     pass
             
             progress.update(task, completed=True)
@@ -132,19 +243,31 @@ def list_processes(args: List[str]) -> None:
         else:
             processes.sort(key=lambda x: x.get('name', '').lower())
         
+        # Rows are gathered first and handed to the table in one go
+        rows = []
+        for proc in processes[:limit]:
+            for field in ('cpu_percent', 'memory_percent'):
+                if field not in proc:
+                    try:
+                        proc[field] = _proc_usage(proc['proc'], field, total_memory)
+                    except _PROC_ERRORS:
+                        pass
+            
+            rows.append((
+                str(proc.get('pid', 'N/A')),
+                proc.get('name', 'N/A')[:30],
+                f"{proc.get('cpu_percent', 0):.1f}%",
+                f"{proc.get('memory_percent', 0):.2f}%"
+            ))
+        
         table = Table(title=f"Top {limit} Processes (sorted by {sort_by})", show_header=True, header_style="bold magenta")
         table.add_column("PID", style="cyan", justify="right")
         table.add_column("Name", style="green")
         table.add_column("CPU %", style="yellow", justify="right")
         table.add_column("Memory %", style="red", justify="right")
         
-        for proc in processes[:limit]:
-            table.add_row(
-                str(proc.get('pid', 'N/A')),
-                proc.get('name', 'N/A')[:30],
-                f"{proc.get('cpu_percent', 0):.1f}%",
-                f"{proc.get('memory_percent', 0):.2f}%"
-            )
+        for row in rows:
+            table.add_row(*row)
         
         console.print(table)
         console.print(f"\n[dim]Total processes running: {len(processes)}[/dim]")
@@ -153,11 +276,39 @@ def list_processes(args: List[str]) -> None:
         console.print(f"[red]Error listing processes: {e}[/red]")
 
 
+def _safe_disk_usage(mountpoint: str):
+    """Return disk usage for a mount point, or None if it cannot be read."""
+    try:
+        return psutil.disk_usage(mountpoint)
+    except PermissionError:
+        return None
+
+
 def disk_usage(args: List[str]) -> None:
     """Display disk usage information."""
     try:
         partitions = psutil.disk_partitions()
         
+        # statvfs releases the GIL, so a slow network mount no longer stalls the rest
+        usages = []
+        if partitions:
+            with ThreadPoolExecutor(max_workers=min(16, len(partitions))) as executor:
+                usages = list(executor.map(_safe_disk_usage, (p.mountpoint for p in partitions)))
+        
+        rows = [
+            (
+                partition.device,
+                partition.mountpoint,
+                partition.fstype,
+                f"{usage.total / (1024**3):.1f} GB",
+                f"{usage.used / (1024**3):.1f} GB",
+                f"{usage.free / (1024**3):.1f} GB",
+                f"{usage.percent}%"
+            )
+            for partition, usage in zip(partitions, usages)
+            if usage is not None
+        ]
+        
         table = Table(title="Disk Usage", show_header=True, header_style="bold magenta")
         table.add_column("Device", style="cyan")
         table.add_column("Mount Point", style="green")
@@ -167,20 +318,8 @@ def disk_usage(args: List[str]) -> None:
         table.add_column("Free", style="green", justify="right")
         table.add_column("Usage %", style="magenta", justify="right")
         
-        for partition in partitions:
-            try:
-                usage = psutil.disk_usage(partition.mountpoint)
-                table.add_row(
-                    partition.device,
-                    partition.mountpoint,
-                    partition.fstype,
-                    f"{usage.total / (1024**3):.1f} GB",
-                    f"{usage.used / (1024**3):.1f} GB",
-                    f"{usage.free / (1024**3):.1f} GB",
-                    f"{usage.percent}%"
-                )
-            except PermissionError:
-                continue
+        for row in rows:
+            table.add_row(*row)
         
         console.print(table)
         
@@ -188,6 +327,24 @@ def disk_usage(args: List[str]) -> None:
         console.print(f"[red]Error checking disk usage: {e}[/red]")
 
 
+def environment_table(filter_str: str = "") -> Table:
+    """Build the environment variable table, optionally filtered by an uppercase substring."""
+    # Filter before sorting so only matching entries pay for the sort
+    items = [(k, v) for k, v in os.environ.items() if not filter_str or filter_str in k.upper()]
+    items.sort()
+    
+    rows = [(key, value[:80] + "..." if len(value) > 80 else value) for key, value in islice(items, 50)]
+    
+    table = Table(title="Environment Variables", show_header=True, header_style="bold magenta")
+    table.add_column("Variable", style="cyan")
+    table.add_column("Value", style="green")
+    
+    for row in rows:
+        table.add_row(*row)
+    
+    return table
+
+
 def show_environment(args: List[str]) -> None:
     """Show environment variables."""
     filter_str = ""
@@ -195,20 +352,7 @@ def show_environment(args: List[str]) -> None:
         filter_str = args[0].upper()
     
     try:
-        table = Table(title="Environment Variables", show_header=True, header_style="bold magenta")
-        table.add_column("Variable", style="cyan")
-        table.add_column("Value", style="green")
-        
-        count = 0
-        for key, value in sorted(os.environ.items()):
-            if filter_str and filter_str not in key.upper():
-                continue
-            table.add_row(key, value[:80] + "..." if len(value) > 80 else value)
-            count += 1
-            if count >= 50:
-                break
-        
-        console.print(table)
+        console.print(environment_table(filter_str))
         
         if filter_str:
             console.print(f"\n[dim]Showing variables containing '{filter_str}'[/dim]")
@@ -221,10 +365,11 @@ def show_environment(args: List[str]) -> None:
 
 def whoami_command(args: List[str]) -> None:
     """Display current user information."""
-    import pwd
-    import grp
-    
     try:
+        if pwd is None:
+            _whoami_basic()
+            return
+        
         user_info = pwd.getpwuid(os.getuid())
         username = user_info.pw_name
         uid = user_info.pw_uid
@@ -259,11 +404,23 @@ def whoami_command(args: List[str]) -> None:
         console.print(f"[red]Error getting user info: {e}[/red]")
 
 
+def _whoami_basic() -> None:
+    """Show the user details available without the pwd/grp modules."""
+    table = Table(title="👤 Current User Information", show_header=False)
+    table.add_column("Property", style="cyan bold")
+    table.add_column("Value", style="green")
+    
+    table.add_row("Username", getpass.getuser())
+    table.add_row("Home Directory", os.path.expanduser("~"))
+    table.add_row("Shell", os.environ.get("COMSPEC") or os.environ.get("SHELL", "Unknown"))
+    table.add_row("Process ID", str(os.getpid()))
+    table.add_row("Parent Process ID", str(os.getppid()))
+    
+    console.print(table)
+
+
 def hostname_command(args: List[str]) -> None:
     """Display system hostname and network information."""
-    import socket
-    import platform
-    
     try:
         hostname = socket.gethostname()
         fqdn = socket.getfqdn()
@@ -302,13 +459,9 @@ def hostname_command(args: List[str]) -> None:
 
 def uptime_command(args: List[str]) -> None:
     """Display system uptime and load average."""
-    from datetime import timedelta
-    import time as time_module
-    import datetime as datetime_module
-    
     try:
-        boot_time = psutil.boot_time()
-        uptime_seconds = time_module.time() - boot_time
+        boot_time = _boot_time()
+        uptime_seconds = time.time() - boot_time
         uptime_delta = timedelta(seconds=int(uptime_seconds))
         
         # Get load average (Unix-like systems)
@@ -331,7 +484,7 @@ def uptime_command(args: List[str]) -> None:
         table.add_column("Value", style="green")
         
         table.add_row("Uptime", f"{days} days, {hours} hours, {minutes} minutes")
-        table.add_row("Boot Time", datetime_module.datetime.fromtimestamp(boot_time).strftime("%Y-%m-%d %H:%M:%S"))
+        table.add_row("Boot Time", datetime.fromtimestamp(boot_time).strftime("%Y-%m-%d %H:%M:%S"))
         table.add_row("Current Users", str(users))
         
         if load_available:
@@ -340,7 +493,12 @@ def uptime_command(args: List[str]) -> None:
             table.add_row("Load Average (15m)", f"{load15:.2f}")
         
         # CPU and Memory summary
-        cpu_percent = psutil.cpu_percent(interval=1)
+        now = time.monotonic()
+        if now - _LAST_CPU['t'] < CPU_SAMPLE_MIN_INTERVAL:
+            cpu_percent = _LAST_CPU['v']
+        else:
+            cpu_percent = psutil.cpu_percent(interval=None)
+            _LAST_CPU.update(t=now, v=cpu_percent)
         mem = psutil.virtual_memory()
         
         table.add_row("CPU Usage", f"{cpu_percent}%")
@@ -354,9 +512,6 @@ def uptime_command(args: List[str]) -> None:
 
 def date_command(args: List[str]) -> None:
     """Display current date and time in various formats."""
-    from datetime import datetime, timezone
-    import time
-    
     now = datetime.now()
     utc_now = datetime.now(timezone.utc)
     
@@ -377,6 +532,21 @@ def date_command(args: List[str]) -> None:
     console.print(table)
 
 
+@lru_cache(maxsize=256)
+def _dir_entries(directory: str, mtime_ns: int) -> frozenset:
+    """
+    List a directory's entry names once per modification time.
+    
+    Keying on mtime means a PATH directory is only re-scanned after
+    something is installed into or removed from it.
+    """
+    try:
+        with os.scandir(directory) as it:
+            return frozenset(os.path.normcase(entry.name) for entry in it)
+    except OSError:
+        return frozenset()
+
+
 def which_command(args: List[str]) -> None:
     """Find the location of a command/executable."""
     if not args:
@@ -393,10 +563,18 @@ def which_command(args: List[str]) -> None:
         if not directory:
             continue
         
+        try:
+            entries = _dir_entries(directory, os.stat(directory).st_mtime_ns)
+        except OSError:
+            continue
+        
         full_path = os.path.join(directory, command)
         
-        # Check with and without common extensions
+        # Check with and without common extensions; only names present in the
+        # directory listing are stat'ed
         for ext in ["", ".exe", ".bat", ".cmd", ".sh"]:
+            if os.path.normcase(command + ext) not in entries:
+                continue
             check_path = full_path + ext
             if os.path.isfile(check_path) and os.access(check_path, os.X_OK):
                 found_paths.append(check_path)
@@ -409,10 +587,9 @@ def which_command(args: List[str]) -> None:
         
         for path in found_paths:
             try:
-                import datetime as datetime_module
                 stat_info = os.stat(path)
                 size = stat_info.st_size
-                mtime = datetime_module.datetime.fromtimestamp(stat_info.st_mtime)
+                mtime = datetime.fromtimestamp(stat_info.st_mtime)
                 
                 # Format size
                 size_str = f"{size:,} bytes"
@@ -8,11 +8,47 @@ from rich.table import Table
 from rich.panel import Panel
 from pathlib import Path
 from typing import List
+import codecs
 import re
-from collections import Counter
+from collections import Counter, deque
 
 console = Console()
 
+# All log levels in one pattern so each block is scanned once; a line that
+# mentions several levels is classified by the most severe one. The pattern
+# runs over lowercased bytes, and the lookahead skips positions that cannot
+# start a keyword before the alternation is tried.
+LOG_LEVEL_PATTERN = re.compile(
+    rb'(?=[edfiwt])\b(?:(?P<error>error|err|exception|failed|failure)'
+    rb'|(?P<warning>warning|warn)'
+    rb'|(?P<info>info|information)'
+    rb'|(?P<debug>debug|trace))\b'
+)
+# The same keywords matched on decoded text. Blocks with non-ASCII bytes use
+# this one, because UTF-8 lead bytes are not \w in a bytes pattern and \b
+# would otherwise split a keyword from an adjacent non-ASCII letter.
+LOG_LEVEL_TEXT_PATTERN = re.compile(
+    r'\b(?:(?P<error>error|err|exception|failed|failure)'
+    r'|(?P<warning>warning|warn)'
+    r'|(?P<info>info|information)'
+    r'|(?P<debug>debug|trace))\b',
+    re.IGNORECASE
+)
+LEVEL_PRIORITY = {'error': 0, 'warning': 1, 'info': 2, 'debug': 3}
+
+# Words with 4+ chars; the bytes form is only valid on ASCII input
+WORD_PATTERN = re.compile(r'\b\w{4,}\b')
+ASCII_WORD_PATTERN = re.compile(rb'\b\w{4,}\b')
+
+
+LOG_BATCH_SIZE = 1 << 20
+WORD_COUNT_CHUNK_SIZE = 1 << 20
+
+
+def _decode(data: bytes) -> str:
+    """Decode file bytes for display, dropping invalid sequences."""
+    return data.decode('utf-8', errors='ignore')
+
 
 def log_analyze(args: List[str]) -> None:
     """Analyze log files."""
@@ -27,66 +63,103 @@ def log_analyze(args: List[str]) -> None:
             console.print(f"[red]File not found: {file_path}[/red]")
             return
         
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            lines = f.readlines()
-        
-        # Count log levels
-        error_count = 0
-        warning_count = 0
-        info_count = 0
-        debug_count = 0
-        
-        error_pattern = re.compile(r'\b(error|err|exception|failed|failure)\b', re.IGNORECASE)
-        warning_pattern = re.compile(r'\b(warning|warn)\b', re.IGNORECASE)
-        info_pattern = re.compile(r'\b(info|information)\b', re.IGNORECASE)
-        debug_pattern = re.compile(r'\b(debug|trace)\b', re.IGNORECASE)
-        
-        recent_errors = []
-        
-        for i, line in enumerate(lines):
-            if error_pattern.search(line):
-                error_count += 1
-                if len(recent_errors) < 5:
-                    recent_errors.append((i + 1, line.strip()[:80]))
-            elif warning_pattern.search(line):
-                warning_count += 1
-            elif info_pattern.search(line):
-                info_count += 1
-            elif debug_pattern.search(line):
-                debug_count += 1
+        # Lines per log level, keyed by the pattern's group names
+        level_counts = Counter()
+        total_lines = 0
+        
+        # Keeps the last five errors; older entries fall off automatically
+        recent_errors = deque(maxlen=5)
+        word_counter = Counter()
+        
+        # Stream raw bytes in ~1 MiB blocks, each extended to the end of its
+        # last line. Levels and words are found with one finditer/findall per
+        # block; only blocks containing non-ASCII text pay for a UTF-8 decode
+        # so their words and levels are still matched as characters.
+        with open(file_path, 'rb') as f:
+            block = b''
+            while True:
+                chunk = f.read(LOG_BATCH_SIZE)
+                if not chunk:
+                    break
+                if not chunk.endswith(b'\n'):
+                    chunk += f.readline()
+                block = chunk
+                
+                if block.isascii():
+                    # Lowercasing ASCII keeps offsets, so matches index the raw block
+                    text, newline = block, b'\n'
+                    lowered = block.lower()
+                    word_counter.update(ASCII_WORD_PATTERN.findall(lowered))
+                    matches = LOG_LEVEL_PATTERN.finditer(lowered)
+                else:
+                    text, newline = _decode(block), '\n'
+                    word_counter.update(
+                        word.encode('utf-8') for word in WORD_PATTERN.findall(text.lower())
+                    )
+                    matches = LOG_LEVEL_TEXT_PATTERN.finditer(text)
+                
+                # Most severe level per line, keyed by the line's start offset
+                line_levels = {}
+                for m in matches:
+                    start = text.rfind(newline, 0, m.start()) + 1
+                    level = m.lastgroup
+                    current = line_levels.get(start)
+                    if current is None or LEVEL_PRIORITY[level] < LEVEL_PRIORITY[current]:
+                        line_levels[start] = level
+                
+                level_counts.update(line_levels.values())
+                
+                # Only the last few errors of a block can survive in the deque,
+                # so line numbers are computed for those alone
+                error_starts = [start for start, level in line_levels.items() if level == 'error']
+                for start in error_starts[-recent_errors.maxlen:]:
+                    line_no = total_lines + 1 + text.count(newline, 0, start)
+                    end = text.find(newline, start)
+                    recent_errors.append((line_no, text[start:] if end < 0 else text[start:end]))
+                
+                total_lines += block.count(b'\n')
+            
+            # A final line without a trailing newline still counts
+            if block and not block.endswith(b'\n'):
+                total_lines += 1
         
         # Display summary
-        summary_text = f"[bold]Total Lines:[/bold] {len(lines)}\n"
-        summary_text += f"[bold red]Errors:[/bold red] {error_count}\n"
-        summary_text += f"[bold yellow]Warnings:[/bold yellow] {warning_count}\n"
-        summary_text += f"[bold green]Info:[/bold green] {info_count}\n"
-        summary_text += f"[bold blue]Debug:[/bold blue] {debug_count}\n"
+        summary_text = f"[bold]Total Lines:[/bold] {total_lines}\n"
+        summary_text += f"[bold red]Errors:[/bold red] {level_counts['error']}\n"
+        summary_text += f"[bold yellow]Warnings:[/bold yellow] {level_counts['warning']}\n"
+        summary_text += f"[bold green]Info:[/bold green] {level_counts['info']}\n"
+        summary_text += f"[bold blue]Debug:[/bold blue] {level_counts['debug']}\n"
         
         console.print(Panel(summary_text, title="Log Analysis Summary", border_style="blue"))
         
         # Show recent errors
         if recent_errors:
+            rows = [
+                (str(line_num), (_decode(line) if isinstance(line, bytes) else line).strip()[:80])
+                for line_num, line in recent_errors
+            ]
+            
             table = Table(title="Recent Errors", show_header=True, header_style="bold magenta")
             table.add_column("Line", style="cyan", width=8)
             table.add_column("Message", style="red")
             
-            for line_num, message in recent_errors:
-                table.add_row(str(line_num), message)
+            for row in rows:
+                table.add_row(*row)
             
             console.print(table)
         
         # Get most common words
-        all_text = ' '.join(lines).lower()
-        words = re.findall(r'\b\w{4,}\b', all_text)  # Words with 4+ chars
-        word_counts = Counter(words).most_common(10)
+        word_counts = word_counter.most_common(10)
         
         if word_counts:
+            rows = [(_decode(word), str(count)) for word, count in word_counts]
+            
             table = Table(title="Most Common Words", show_header=True, header_style="bold magenta")
             table.add_column("Word", style="cyan")
             table.add_column("Count", style="green", justify="right")
             
-            for word, count in word_counts:
-                table.add_row(word, str(count))
+            for row in rows:
+                table.add_row(*row)
             
             console.print(table)
         
@@ -107,11 +180,22 @@ def text_stats(args: List[str]) -> None:
             console.print(f"[red]File not found: {file_path}[/red]")
             return
         
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
+        with open(file_path, 'rb') as f:
+            data = f.read()
+        
+        # Apply the same newline translation text mode would
+        data = data.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+        
+        # ASCII files are counted directly as bytes; anything else is decoded
+        # so that lengths stay measured in characters
+        if data.isascii():
+            content, newline = data, b'\n'
+        else:
+            content, newline = _decode(data), '\n'
         
-        lines = content.split('\n')
-        words = content.split()
+        lines = content.split(newline)
+        # Lower once up front; the same word list feeds the counts and the Counter
+        words = content.lower().split()
         
         # Count various elements
         char_count = len(content)
@@ -122,10 +206,10 @@ def text_stats(args: List[str]) -> None:
         empty_lines = sum(1 for line in lines if not line.strip())
         
         # Average word length
-        avg_word_length = sum(len(word) for word in words) / word_count if word_count > 0 else 0
+        avg_word_length = sum(map(len, words)) / word_count if word_count > 0 else 0
         
         # Longest line
-        longest_line_length = max(len(line) for line in lines) if lines else 0
+        longest_line_length = max(map(len, lines))
         
         # Display stats
         stats_text = f"[bold]Characters:[/bold] {char_count:,}\n"
@@ -139,7 +223,7 @@ def text_stats(args: List[str]) -> None:
         console.print(Panel(stats_text, title="Text File Statistics", border_style="green"))
         
         # Word frequency
-        word_freq = Counter(word.lower() for word in words)
+        word_freq = Counter(words)
         top_words = word_freq.most_common(10)
         
         if top_words:
@@ -148,7 +232,7 @@ def text_stats(args: List[str]) -> None:
             table.add_column("Frequency", style="green", justify="right")
             
             for word, freq in top_words:
-                table.add_row(word, str(freq))
+                table.add_row(_decode(word) if isinstance(word, bytes) else word, str(freq))
             
             console.print(table)
         
@@ -169,19 +253,50 @@ def word_count(args: List[str]) -> None:
             console.print(f"[red]File not found: {file_path}[/red]")
             return
         
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
+        # Count in fixed-size chunks with running totals, matching what a
+        # text-mode read would report: \r\n and lone \r end lines, and
+        # characters are measured after dropping invalid UTF-8. ASCII chunks
+        # are counted as bytes; other chunks go through an incremental
+        # decoder so multi-byte characters split across chunks survive.
+        decoder = codecs.getincrementaldecoder('utf-8')('ignore')
+        line_count = 1
+        word_total = 0
+        chars = 0
+        in_word = False
+        last_cr = False
         
-        lines = content.split('\n')
-        words = content.split()
-        chars = len(content)
+        with open(file_path, 'rb') as f:
+            while True:
+                chunk = f.read(WORD_COUNT_CHUNK_SIZE)
+                if not chunk:
+                    break
+                
+                crlf = chunk.count(b'\r\n')
+                if last_cr and chunk.startswith(b'\n'):
+                    crlf += 1
+                last_cr = chunk.endswith(b'\r')
+                line_count += chunk.count(b'\n') + chunk.count(b'\r') - crlf
+                
+                if chunk.isascii() and not decoder.getstate()[0]:
+                    text = chunk
+                else:
+                    text = decoder.decode(chunk)
+                if not text:
+                    continue
+                
+                chars += len(text) - crlf
+                word_total += len(text.split())
+                # A word running across the chunk boundary was counted twice
+                if in_word and not text[:1].isspace():
+                    word_total -= 1
+                in_word = not text[-1:].isspace()
         
         # Display results in a simple format
         result_text = f"""
 [bold cyan]File:[/bold cyan] {file_path.name}
 
-[bold yellow]Lines:[/bold yellow]      {len(lines):>10,}
-[bold green]Words:[/bold green]      {len(words):>10,}
+[bold yellow]Lines:[/bold yellow]      {line_count:>10,}
+[bold green]Words:[/bold green]      {word_total:>10,}
 [bold blue]Characters:[/bold blue] {chars:>10,}
 """
         
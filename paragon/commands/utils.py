@@ -8,16 +8,67 @@ from rich.table import Table
 from rich.panel import Panel
 from rich.markdown import Markdown
 from rich.progress import Progress, SpinnerColumn, TextColumn
-from alive_progress import alive_bar
 import requests
-import secrets
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import atexit
+import base64
+import hashlib
+import mmap
+import os
+import re
 import string
+import time
+import uuid
+from functools import lru_cache
+from itertools import product
 from pathlib import Path
-from typing import List
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 from paragon.core.config import config
+from paragon import __version__
 
 console = Console()
 
+# Shared session so repeat conversions reuse the pooled keep-alive connection;
+# transient failures are retried with a short backoff
+_retry = Retry(total=config.get("network.max_retries", 3), backoff_factor=0.2)
+_session = requests.Session()
+_session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=_retry))
+_session.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=_retry))
+_session.headers['User-Agent'] = f"PythonParagon/{__version__}"
+atexit.register(_session.close)
+
+# Markdown files above the threshold are rendered block by block
+MARKDOWN_STREAM_THRESHOLD = 256 * 1024
+MARKDOWN_BLOCK_SIZE = 64 * 1024
+
+# Fence openers/closers (up to 3 spaces of indent) and link reference definitions
+MARKDOWN_FENCE_PATTERN = re.compile(r' {0,3}(`{3,}|~{3,})(.*)')
+MARKDOWN_LINK_DEF_PATTERN = re.compile(r' {0,3}\[[^\]]+\]:\s*\S')
+
+HASH_CHUNK_SIZE = 1 << 20
+
+_HASHERS = {
+    "md5": hashlib.md5,
+    "sha1": hashlib.sha1,
+    "sha256": hashlib.sha256,
+    "sha512": hashlib.sha512,
+}
+
+# Password character sets for every (no_uppercase, no_numbers, no_special) combination
+_CHARSET_TABLE: Dict[Tuple[bool, bool, bool], str] = {
+    (no_upper, no_num, no_special): "".join([
+        string.ascii_lowercase,
+        "" if no_upper else string.ascii_uppercase,
+        "" if no_num else string.digits,
+        "" if no_special else string.punctuation,
+    ])
+    for no_upper, no_num, no_special in product((False, True), repeat=3)
+}
+
+# Rate tables by base currency as (monotonic fetch time, response JSON)
+_RATE_CACHE: Dict[str, Tuple[float, dict]] = {}
+
 
 def currency_converter(args: List[str]) -> None:
     """Convert currency using live exchange rates."""
@@ -30,21 +81,30 @@ def currency_converter(args: List[str]) -> None:
         from_currency = args[1].upper()
         to_currency = args[2].upper()
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-            transient=True
-        ) as progress:
-            task = progress.add_task("Fetching exchange rates...", total=None)
-            
-            api_url = config.get("api.currency_api", "https://api.exchangerate-api.com/v4/latest/")
-            timeout = config.get("network.timeout", 10)
-            
-            response = requests.get(f"{api_url}{from_currency}", timeout=timeout)
-            response.raise_for_status()
+        # Repeat conversions from the same base within the TTL skip the network
+        cache_ttl = config.get("api.currency_cache_ttl", 300)
+        cached = _RATE_CACHE.get(from_currency)
+        
+        if cached is not None and time.monotonic() - cached[0] < cache_ttl:
+            data = cached[1]
+        else:
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                console=console,
+                transient=True
+            ) as progress:
+                task = progress.add_task("Fetching exchange rates...", total=None)
+                
+                api_url = config.get("api.currency_api", "https://api.exchangerate-api.com/v4/latest/")
+                timeout = config.get("network.timeout", 10)
+                
+                response = _session.get(f"{api_url}{from_currency}", timeout=timeout)
+                response.raise_for_status()
+                
+                data = response.json()
             
-            data = response.json()
+            _RATE_CACHE[from_currency] = (time.monotonic(), data)
         
         if 'rates' not in data or to_currency not in data['rates']:
             console.print(f"[red]Currency code not found: {to_currency}[/red]")
@@ -72,6 +132,39 @@ def currency_converter(args: List[str]) -> None:
         console.print(f"[red]Error: {e}[/red]")
 
 
+@lru_cache(maxsize=8)
+def _translate_tables(characters: str) -> Tuple[int, bytes, bytes]:
+    """Return the rejection limit, rejected bytes and byte-to-character table for a charset."""
+    charset = characters.encode('ascii')
+    n = len(charset)
+    limit = 256 - 256 % n
+    return limit, bytes(range(limit, 256)), bytes(charset[b % n] for b in range(256))
+
+
+def _random_passwords(characters: str, count: int, length: int) -> List[str]:
+    """
+    Generate passwords from a single os.urandom buffer.
+    
+    Random bytes that would bias the modulo mapping are dropped with
+    bytes.translate(None, ...), and the survivors are mapped onto the
+    character set with a 256-entry translate table, so no per-character
+    Python code runs.
+    """
+    limit, rejected, table = _translate_tables(characters)
+    
+    # Size each draw from the acceptance rate (limit/256) plus a little slack,
+    # so one os.urandom call almost always suffices without over-reading
+    needed = count * length
+    pool = b''
+    while len(pool) < needed:
+        missing = needed - len(pool)
+        draw = missing * 256 // limit + missing // 16 + 16
+        pool += os.urandom(draw).translate(None, rejected)
+    
+    text = pool[:needed].translate(table).decode('ascii')
+    return [text[i:i + length] for i in range(0, needed, length)]
+
+
 def password_generator(args: List[str]) -> None:
     """Generate secure random passwords."""
     length = 16
@@ -110,48 +203,36 @@ def password_generator(args: List[str]) -> None:
             console.print("[red]Count must be between 1 and 100[/red]")
             return
         
-        characters = string.ascii_lowercase
-        
-        if not no_uppercase:
-            characters += string.ascii_uppercase
-        
-        if not no_numbers:
-            characters += string.digits
-        
-        if not no_special:
-            characters += string.punctuation
+        characters = _CHARSET_TABLE[(no_uppercase, no_numbers, no_special)]
         
         if len(characters) < 4:
             console.print("[red]Character set too small. Enable at least one character type.[/red]")
             return
         
-        passwords = []
+        passwords = _random_passwords(characters, count, length)
         
-        if count > 5:
-            with alive_bar(count, title='Generating passwords', bar='classic', spinner='dots') as bar:
-                for _ in range(count):
-                    password = ''.join(secrets.choice(characters) for _ in range(length))
-                    passwords.append(password)
-                    bar()
+        # Piped or redirected output gets bare values, one per line
+        if not console.is_terminal:
+            print("\n".join(passwords))
+            return
+        
+        # Strength only depends on the options, so it is the same for every row
+        if length >= 16 and not no_special and not no_numbers:
+            strength = "🟢 Strong"
+        elif length >= 12:
+            strength = "🟡 Medium"
         else:
-            for _ in range(count):
-                password = ''.join(secrets.choice(characters) for _ in range(length))
-                passwords.append(password)
+            strength = "🔴 Weak"
+        
+        rows = [(str(i), f"[bold]{pwd}[/bold]", strength) for i, pwd in enumerate(passwords, 1)]
         
         table = Table(title=f"Generated Password(s)", show_header=True, header_style="bold magenta")
         table.add_column("#", style="cyan", justify="center")
         table.add_column("Password", style="green")
         table.add_column("Strength", style="yellow")
         
-        for i, pwd in enumerate(passwords, 1):
-            if length >= 16 and not no_special and not no_numbers:
-                strength = "🟢 Strong"
-            elif length >= 12:
-                strength = "🟡 Medium"
-            else:
-                strength = "🔴 Weak"
-            
-            table.add_row(str(i), f"[bold]{pwd}[/bold]", strength)
+        for row in rows:
+            table.add_row(*row)
         
         console.print(table)
         
@@ -169,6 +250,67 @@ def password_generator(args: List[str]) -> None:
         console.print(f"[red]Error generating password: {e}[/red]")
 
 
+def _update_fence(line: str, fence: Optional[str]) -> Optional[str]:
+    """
+    Return the code fence that is open after line, or None outside a fenced block.
+    
+    A fence only closes on a line of the same character that is at least
+    as long as the opening one and carries no info string.
+    """
+    match = MARKDOWN_FENCE_PATTERN.match(line)
+    if match is None:
+        return fence
+    
+    marker, rest = match.groups()
+    if fence is None:
+        # Backtick fences cannot have backticks in their info string
+        if marker[0] == '`' and '`' in rest:
+            return None
+        return marker
+    
+    if marker[0] == fence[0] and len(marker) >= len(fence) and not rest.strip():
+        return None
+    return fence
+
+
+def _markdown_link_definitions(lines: Iterable[str]) -> str:
+    """Collect the single-line link reference definitions outside code fences."""
+    definitions = []
+    fence = None
+    
+    for line in lines:
+        if fence is None and MARKDOWN_LINK_DEF_PATTERN.match(line):
+            definitions.append(line)
+        fence = _update_fence(line, fence)
+    
+    return ''.join(definitions)
+
+
+def _markdown_blocks(lines: Iterable[str]) -> Iterator[str]:
+    """
+    Group markdown lines into blocks of roughly MARKDOWN_BLOCK_SIZE characters.
+    
+    Blocks only end on a blank line outside a fenced code block, so each
+    one parses on its own.
+    """
+    block = []
+    size = 0
+    fence = None
+    
+    for line in lines:
+        fence = _update_fence(line, fence)
+        block.append(line)
+        size += len(line)
+        
+        if size >= MARKDOWN_BLOCK_SIZE and fence is None and not line.strip():
+            yield ''.join(block)
+            block = []
+            size = 0
+    
+    if block:
+        yield ''.join(block)
+
+
 def markdown_renderer(args: List[str]) -> None:
     """Render markdown with beautiful formatting."""
     if not args:
@@ -183,8 +325,37 @@ def markdown_renderer(args: List[str]) -> None:
             console.print(f"[red]File not found: {file}[/red]")
             return
         
-        with open(file_path, 'r', encoding='utf-8') as f:
-            markdown_content = f.read()
+        # Refuse oversized files up front rather than loading them
+        size = file_path.stat().st_size
+        max_size_mb = config.get("file_operations.max_file_size_mb", 100)
+        if size > max_size_mb * 1024 * 1024:
+            console.print(
+                f"[red]File too large to render: {size / (1024 * 1024):.1f} MB "
+                f"(limit {max_size_mb} MB)[/red]"
+            )
+            return
+        
+        # Large documents are parsed and printed a block at a time so the
+        # cost of each parse and layout stays bounded. Link reference
+        # definitions are gathered in a first pass and appended to every
+        # block, so [text][ref] resolves wherever [ref]: is defined.
+        if size > MARKDOWN_STREAM_THRESHOLD:
+            console.rule("[bold]Markdown Preview[/bold]", style="blue")
+            with open(file_path, 'r', encoding='utf-8') as f:
+                definitions = _markdown_link_definitions(f)
+                f.seek(0)
+                for block in _markdown_blocks(f):
+                    if definitions:
+                        block = f"{block}\n\n{definitions}"
+                    console.print(Markdown(block))
+            console.rule(style="blue")
+            return
+        
+        markdown_content = ""
+        if size:
+            # Decode straight from the mapped pages, skipping the bytes copy
+            with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                markdown_content = str(mm, 'utf-8')
         
         if not markdown_content:
             console.print("[yellow]No content to render[/yellow]")
@@ -207,17 +378,23 @@ def base64_converter(args: List[str]) -> None:
     decode = '--decode' in args or '-d' in args
     
     try:
-        import base64
-        
         if decode:
+            # validate=True rejects non-alphabet characters in the same C pass
+            # that decodes, instead of silently discarding them
             try:
-                decoded = base64.b64decode(text).decode('utf-8')
-                result = decoded
-                operation = "Decoded"
-                color = "green"
-            except Exception as e:
+                raw = base64.b64decode(text, validate=True)
+            except ValueError as e:
                 console.print(f"[red]Invalid Base64 string: {e}[/red]")
                 return
+            
+            try:
+                result = raw.decode('utf-8')
+            except UnicodeDecodeError:
+                console.print("[red]Decoded data is not valid UTF-8 text[/red]")
+                return
+            
+            operation = "Decoded"
+            color = "green"
         else:
             encoded = base64.b64encode(text.encode('utf-8')).decode('utf-8')
             result = encoded
@@ -235,42 +412,75 @@ def base64_converter(args: List[str]) -> None:
         console.print(f"[red]Error: {e}[/red]")
 
 
+def _hash_file(file_path: Path, constructor):
+    """Hash a file without loading it whole, using hashlib.file_digest when available."""
+    with open(file_path, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+            return hashlib.file_digest(f, constructor)
+        
+        # Same approach as file_digest: refill one buffer and hash views of
+        # it, so no bytes object is allocated per chunk
+        hash_obj = constructor()
+        buf = bytearray(HASH_CHUNK_SIZE)
+        view = memoryview(buf)
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                break
+            hash_obj.update(view[:n])
+        return hash_obj
+
+
 def hash_text(args: List[str]) -> None:
-    """Generate hash of text using various algorithms."""
+    """Generate hash of text or a file using various algorithms."""
     if not args:
-        console.print("[red]Usage: hash <text> [--algorithm sha256][/red]")
+        console.print("[red]Usage: hash <text> | --file <path> [--algorithm sha256][/red]")
         return
     
-    text = args[0]
+    text = None
+    file_path = None
     algorithm = "sha256"
     
-    # Parse algorithm
-    i = 1
+    # Parse args
+    i = 0
     while i < len(args):
         if args[i] in ['--algorithm', '-a'] and i + 1 < len(args):
             algorithm = args[i + 1].lower()
             i += 2
+        elif args[i] in ['--file', '-f'] and i + 1 < len(args):
+            file_path = Path(args[i + 1])
+            i += 2
         else:
+            if text is None:
+                text = args[i]
             i += 1
     
+    if text is None and file_path is None:
+        console.print("[red]Usage: hash <text> | --file <path> [--algorithm sha256][/red]")
+        return
+    
     try:
-        import hashlib
-        
-        if algorithm == "md5":
-            hash_obj = hashlib.md5(text.encode('utf-8'))
-        elif algorithm == "sha1":
-            hash_obj = hashlib.sha1(text.encode('utf-8'))
-        elif algorithm == "sha256":
-            hash_obj = hashlib.sha256(text.encode('utf-8'))
-        elif algorithm == "sha512":
-            hash_obj = hashlib.sha512(text.encode('utf-8'))
-        else:
+        constructor = _HASHERS.get(algorithm)
+        if constructor is None:
             console.print(f"[red]Unsupported algorithm: {algorithm}[/red]")
-            console.print("Supported: md5, sha1, sha256, sha512")
+            console.print(f"Supported: {', '.join(_HASHERS)}")
             return
         
+        if file_path is not None:
+            if not file_path.is_file():
+                console.print(f"[red]File not found: {file_path}[/red]")
+                return
+            hash_obj = _hash_file(file_path, constructor)
+        else:
+            hash_obj = constructor(text.encode('utf-8'))
+        
         hash_value = hash_obj.hexdigest()
         
+        # Piped or redirected output gets a bare "algorithm<TAB>hash" line
+        if not console.is_terminal:
+            print(f"{algorithm}\t{hash_value}")
+            return
+        
         table = Table(title="Hash Result", show_header=True, header_style="bold magenta")
         table.add_column("Algorithm", style="cyan")
         table.add_column("Hash", style="green")
@@ -279,6 +489,9 @@ def hash_text(args: List[str]) -> None:
         
         console.print(table)
         
+        if file_path is not None:
+            console.print(f"[dim]File: {file_path}[/dim]")
+        
         if algorithm in ["md5", "sha1"]:
             console.print("\n[yellow]⚠ Warning: This algorithm is not recommended for security purposes.[/yellow]")
         
@@ -286,6 +499,13 @@ def hash_text(args: List[str]) -> None:
         console.print(f"[red]Error generating hash: {e}[/red]")
 
 
+def _uuid4_batch(count: int) -> List[str]:
+    """Build count random UUIDs from one os.urandom draw instead of one per UUID."""
+    raw = os.urandom(16 * count)
+    # version=4 sets the version and RFC 4122 variant bits, as uuid.uuid4() does
+    return [str(uuid.UUID(bytes=raw[i:i + 16], version=4)) for i in range(0, 16 * count, 16)]
+
+
 def generate_uuid(args: List[str]) -> None:
     """Generate UUIDs (Universally Unique Identifiers)."""
     count = 1
@@ -304,8 +524,6 @@ def generate_uuid(args: List[str]) -> None:
             i += 1
     
     try:
-        import uuid
-        
         if uuid_version not in [1, 4]:
             console.print("[red]Only UUID version 1 and 4 are supported[/red]")
             return
@@ -314,17 +532,22 @@ def generate_uuid(args: List[str]) -> None:
             console.print("[red]Count must be between 1 and 100[/red]")
             return
         
+        if uuid_version == 1:
+            uuids = [str(uuid.uuid1()) for _ in range(count)]
+        else:
+            uuids = _uuid4_batch(count)
+        
+        # Piped or redirected output gets bare values, one per line
+        if not console.is_terminal:
+            print("\n".join(uuids))
+            return
+        
         table = Table(title=f"Generated UUID v{uuid_version}", show_header=True, header_style="bold magenta")
         table.add_column("#", style="cyan", justify="center")
         table.add_column("UUID", style="green")
         
-        for i in range(count):
-            if uuid_version == 1:
-                new_uuid = str(uuid.uuid1())
-            else:
-                new_uuid = str(uuid.uuid4())
-            
-            table.add_row(str(i + 1), new_uuid)
+        for i, new_uuid in enumerate(uuids, 1):
+            table.add_row(str(i), new_uuid)
         
         console.print(table)
         
@@ -7,6 +7,12 @@ from pathlib import Path
 from typing import Any, Dict, Optional
 import yaml
 
+# libyaml's C loader when PyYAML was built with it, otherwise the pure-Python one
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 
 class ConfigManager:
     """Centralized configuration manager using YAML."""
@@ -25,6 +31,7 @@ class ConfigManager:
         
         self.config_path = config_path
         self._config: Dict[str, Any] = {}
+        self._flat: Dict[str, Any] = {}
         self.load_config()
     
     def load_config(self) -> None:
@@ -32,12 +39,27 @@ class ConfigManager:
         try:
             if self.config_path.exists():
                 with open(self.config_path, 'r') as f:
-                    self._config = yaml.safe_load(f) or {}
+                    self._config = yaml.load(f, Loader=_Loader) or {}
             else:
                 self._config = self._get_default_config()
         except Exception as e:
             print(f"Warning: Could not load config file: {e}")
             self._config = self._get_default_config()
+        
+        if not isinstance(self._config, dict):
+            print("Warning: Config file is not a mapping, using defaults")
+            self._config = self._get_default_config()
+        
+        self._flat = {}
+        self._flatten(self._config, "")
+    
+    def _flatten(self, node: Dict[str, Any], prefix: str) -> None:
+        """Record every value under its dotted key path, including nested sections."""
+        for key, value in node.items():
+            path = f"{prefix}{key}"
+            self._flat[path] = value
+            if isinstance(value, dict):
+                self._flatten(value, f"{path}.")
     
     def _get_default_config(self) -> Dict[str, Any]:
         """Return default configuration if config file is not available."""
@@ -49,7 +71,8 @@ class ConfigManager:
             },
             "api": {
                 "currency_api": "https://api.exchangerate-api.com/v4/latest/",
-                "ip_api": "https://api.ipify.org?format=json"
+                "ip_api": "https://api.ipify.org?format=json",
+                "currency_cache_ttl": 300
             },
             "network": {
                 "timeout": 10,
@@ -67,7 +90,8 @@ class ConfigManager:
                 "timeout": 30
             },
             "git": {
-                "default_branch": "main"
+                "default_branch": "main",
+                "diff_max_lines": 500
             }
         }
     
@@ -82,16 +106,7 @@ class ConfigManager:
         Returns:
             Configuration value or default
         """
-        keys = key.split('.')
-        value = self._config
-        
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
-        
-        return value
+        return self._flat.get(key, default)
     
     def get_all(self) -> Dict[str, Any]:
         """Get the entire configuration dictionary."""
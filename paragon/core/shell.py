@@ -4,7 +4,8 @@ Interactive shell for PythonParagon.
 This module provides the interactive terminal interface for running commands.
 """
 import sys
-from typing import List, Optional, Dict, Callable
+from functools import lru_cache
+from typing import List, Optional, Dict, Callable, Tuple
 from pathlib import Path
 import shlex
 
@@ -22,6 +23,25 @@ from paragon.core.config import config
 
 console = Console()
 
+# Working directory as last set by the cd command, so pwd can skip os.getcwd()
+current_directory: Optional[str] = None
+
+# Characters that make shlex tokenizing differ from a plain whitespace split
+_SHLEX_SPECIAL = frozenset('"\'\\')
+
+
+@lru_cache(maxsize=256)
+def _split_command(input_text: str) -> Tuple[str, ...]:
+    """Tokenize a command line; repeated input is served from the cache."""
+    if _SHLEX_SPECIAL.isdisjoint(input_text):
+        return tuple(input_text.split())
+    
+    try:
+        return tuple(shlex.split(input_text))
+    except ValueError:
+        return tuple(input_text.split())
+
+
 # Custom style for questionary
 custom_style = Style([
     ('qmark', 'fg:#673ab7 bold'),
@@ -36,6 +56,42 @@ custom_style = Style([
 ])
 
 
+# Welcome banner shared by every shell in the process, built on first display
+_WELCOME_PANEL: Optional[Panel] = None
+
+
+def _make_welcome_panel() -> Panel:
+    """Build the welcome banner panel shown when a shell starts."""
+    app_name = config.get("app.name", "PythonParagon")
+    app_version = config.get("app.version", "2.0.0")
+    
+    welcome_text = f"""
+[bold cyan]{app_name}[/bold cyan] Interactive Terminal - v{app_version}
+        
+Welcome to the professional Python terminal application!
+
+[bold]Quick Start:[/bold]
+  • Type [cyan]help[/cyan] to see all available commands
+  • Type [cyan]menu[/cyan] to use the interactive menu
+  • Type [cyan]info[/cyan] to see detailed information
+  • Type [cyan]exit[/cyan] or [cyan]quit[/cyan] to leave the shell
+
+[bold]Example Commands:[/bold]
+  • [green]cpu[/green] - Monitor CPU usage
+  • [green]ip[/green] - Get your public IP
+  • [green]git status[/green] - Check git status
+  • [green]docker ps[/green] - List Docker containers
+  • [green]json-format file.json[/green] - Format JSON file
+"""
+    
+    return Panel(
+        welcome_text,
+        title=f"🚀 {app_name}",
+        border_style="bold blue",
+        box=box.DOUBLE
+    )
+
+
 class InteractiveShell:
     """Interactive shell for PythonParagon."""
     
@@ -47,6 +103,22 @@ class InteractiveShell:
         self.commands: Dict[str, Callable] = {}
         self.aliases: Dict[str, str] = {}
         
+        # Static renderables, built on first display and reused afterwards
+        self._help_table: Optional[Table] = None
+        self._info_panel: Optional[Panel] = None
+        
+        # Built-in shell commands, dispatched by name before the registry
+        self._builtins: Dict[str, Callable[[], bool]] = {
+            'exit': self._builtin_exit,
+            'quit': self._builtin_exit,
+            'help': self._builtin_help,
+            'info': self._builtin_info,
+            'menu': self._builtin_menu,
+            'clear': self._builtin_clear,
+            'history': self._builtin_history,
+            '': lambda: True,
+        }
+        
     def register_command(self, name: str, func: Callable) -> None:
         """Register a command function."""
         self.commands[name] = func
@@ -57,37 +129,20 @@ class InteractiveShell:
     
     def display_welcome(self) -> None:
         """Display welcome banner."""
-        app_name = config.get("app.name", "PythonParagon")
-        app_version = config.get("app.version", "2.0.0")
-        
-        welcome_text = f"""
-[bold cyan]{app_name}[/bold cyan] Interactive Terminal - v{app_version}
-        
-Welcome to the professional Python terminal application!
-
-[bold]Quick Start:[/bold]
-  • Type [cyan]help[/cyan] to see all available commands
-  • Type [cyan]menu[/cyan] to use the interactive menu
-  • Type [cyan]info[/cyan] to see detailed information
-  • Type [cyan]exit[/cyan] or [cyan]quit[/cyan] to leave the shell
-
-[bold]Example Commands:[/bold]
-  • [green]cpu[/green] - Monitor CPU usage
-  • [green]ip[/green] - Get your public IP
-  • [green]git status[/green] - Check git status
-  • [green]docker ps[/green] - List Docker containers
-  • [green]json-format file.json[/green] - Format JSON file
-"""
-        
-        self.console.print(Panel(
-            welcome_text,
-            title=f"🚀 {app_name}",
-            border_style="bold blue",
-            box=box.DOUBLE
-        ))
+        global _WELCOME_PANEL
+        if _WELCOME_PANEL is None:
+            _WELCOME_PANEL = _make_welcome_panel()
+        self.console.print(_WELCOME_PANEL)
     
     def display_help(self) -> None:
         """Display help information with all available commands."""
+        if self._help_table is None:
+            self._help_table = self._build_help_table()
+        self.console.print(self._help_table)
+        self.console.print("\n[dim]💡 Tip: Most commands support --help flag for detailed options[/dim]")
+    
+    def _build_help_table(self) -> Table:
+        """Build the table of available commands."""
         table = Table(
             title="📚 Available Commands",
             show_header=True,
@@ -108,7 +163,7 @@ Welcome to the professional Python terminal application!
         
         # Network commands
         table.add_row("ip", "Network", "Get your public IP address")
-        table.add_row("http <url>", "Network", "Check HTTP status of URL")
+        table.add_row("http <url> [url ...]", "Network", "Check HTTP status of URLs")
         table.add_row("scan <host>", "Network", "Scan ports on a host")
         table.add_row("ping <host>", "Network", "Check if host is reachable")
         table.add_section()
@@ -151,7 +206,7 @@ Welcome to the professional Python terminal application!
         table.add_row("password / pwd", "Utils", "Generate passwords")
         table.add_row("markdown / md <file>", "Utils", "Render markdown")
         table.add_row("base64 / b64", "Utils", "Encode/decode Base64")
-        table.add_row("hash <text>", "Utils", "Generate hash")
+        table.add_row("hash <text> / --file <path>", "Utils", "Generate hash")
         table.add_row("uuid", "Utils", "Generate UUID")
         table.add_section()
         
@@ -163,11 +218,16 @@ Welcome to the professional Python terminal application!
         table.add_row("history", "Shell", "Show command history")
         table.add_row("exit / quit", "Shell", "Exit the shell")
         
-        self.console.print(table)
-        self.console.print("\n[dim]💡 Tip: Most commands support --help flag for detailed options[/dim]")
+        return table
     
     def display_info(self) -> None:
         """Display detailed application information."""
+        if self._info_panel is None:
+            self._info_panel = self._build_info_panel()
+        self.console.print(self._info_panel)
+    
+    def _build_info_panel(self) -> Panel:
+        """Build the application information panel."""
         app_name = config.get("app.name", "PythonParagon")
         app_version = config.get("app.version", "2.0.0")
         app_author = config.get("app.author", "PythonParagon Team")
@@ -193,12 +253,12 @@ A professional Python terminal application with powerful integrations.
   🔧 Git  |  🐳 Docker  |  📄 Text  |  🛠️  Utils
 """
         
-        self.console.print(Panel(
+        return Panel(
             info_text,
             title=f"🚀 About {app_name}",
             border_style="bold blue",
             box=box.DOUBLE
-        ))
+        )
     
     def show_interactive_menu(self) -> Optional[str]:
         """Show interactive menu using questionary."""
@@ -265,19 +325,60 @@ A professional Python terminal application with powerful integrations.
         Returns:
             Tuple of (command_name, arguments_list)
         """
-        try:
-            parts = shlex.split(input_text)
-        except ValueError:
-            parts = input_text.split()
+        parts = _split_command(input_text)
         
         if not parts:
             return "", []
         
         cmd = parts[0].lower()
-        args = parts[1:]
+        # Fresh list each time; the cached tuple must not be mutated
+        args = list(parts[1:])
         
         return cmd, args
     
+    def _builtin_exit(self) -> bool:
+        """Stop the shell loop."""
+        self.running = False
+        self.console.print("[yellow]👋 Goodbye![/yellow]")
+        return True
+    
+    def _builtin_help(self) -> bool:
+        """Show the command reference."""
+        self.display_help()
+        return True
+    
+    def _builtin_info(self) -> bool:
+        """Show application information."""
+        self.display_info()
+        return True
+    
+    def _builtin_menu(self) -> bool:
+        """Run a command picked from the interactive menu."""
+        menu_cmd = self.show_interactive_menu()
+        if menu_cmd:
+            return self.execute_command(menu_cmd, [])
+        return True
+    
+    def _builtin_clear(self) -> bool:
+        """Clear the terminal."""
+        self.console.clear()
+        return True
+    
+    def _builtin_history(self) -> bool:
+        """Show the last 20 commands entered."""
+        if not self.command_history:
+            self.console.print("[yellow]No command history yet[/yellow]")
+        else:
+            table = Table(title="Command History", show_header=True, header_style="bold magenta")
+            table.add_column("#", style="cyan", width=5)
+            table.add_column("Command", style="green")
+            
+            for i, hist_cmd in enumerate(self.command_history[-20:], 1):
+                table.add_row(str(i), hist_cmd)
+            
+            self.console.print(table)
+        return True
+    
     def execute_command(self, cmd: str, args: List[str]) -> bool:
         """
         Execute a command with given arguments.
@@ -294,45 +395,9 @@ A professional Python terminal application with powerful integrations.
             cmd = self.aliases[cmd]
         
         # Handle built-in shell commands
-        if cmd in ['exit', 'quit']:
-            self.running = False
-            self.console.print("[yellow]👋 Goodbye![/yellow]")
-            return True
-        
-        elif cmd == 'help':
-            self.display_help()
-            return True
-        
-        elif cmd == 'info':
-            self.display_info()
-            return True
-        
-        elif cmd == 'menu':
-            menu_cmd = self.show_interactive_menu()
-            if menu_cmd:
-                return self.execute_command(menu_cmd, [])
-            return True
-        
-        elif cmd == 'clear':
-            self.console.clear()
-            return True
-        
-        elif cmd == 'history':
-            if not self.command_history:
-                self.console.print("[yellow]No command history yet[/yellow]")
-            else:
-                table = Table(title="Command History", show_header=True, header_style="bold magenta")
-                table.add_column("#", style="cyan", width=5)
-                table.add_column("Command", style="green")
-                
-                for i, hist_cmd in enumerate(self.command_history[-20:], 1):
-                    table.add_row(str(i), hist_cmd)
-                
-                self.console.print(table)
-            return True
-        
-        elif cmd == '':
-            return True
+        builtin = self._builtins.get(cmd)
+        if builtin is not None:
+            return builtin()
         
         # Check if command exists in registry
         if cmd in self.commands: